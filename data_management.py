@@ -1,62 +1,707 @@
+import atexit
+import dataclasses
+import hashlib
 import json
+import mmap
+import os
+import stat
+import sys
+import tempfile
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from student import Student
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional, ujson or the standard library json module are used as a fallback
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+try:
+    import msgpack
+except ImportError:
+    # msgpack is optional, it is only needed for the binary student data format
+    msgpack = None
+
+try:
+    import zstandard
+    # Level 3 is zstd's default, it compresses JSON well while staying much faster than parsing it
+    _ZSTD_COMPRESSOR = zstandard.ZstdCompressor(level=3)
+    _ZSTD_DECOMPRESSOR = zstandard.ZstdDecompressor()
+except ImportError:
+    # zstandard is optional, it is only needed for compressed '.zst' files
+    zstandard = None
+
+try:
+    import simdjson
+except ImportError:
+    # simdjson is optional, reading falls back to orjson, ujson or the standard library
+    simdjson = None
+
+# Holds one simdjson parser per thread, parsers must not be shared between threads
+_parser_local = threading.local()
+
+def _loads_simdjson(data):
+    """
+    Deserialize JSON bytes using the simdjson parser.
+    
+    Parameters:
+    - data: The raw JSON document as bytes.
+    
+    Returns:
+    - The deserialized Python object.
+    """
+    # Each thread reuses its parser so the internal buffers are allocated only once
+    parser = getattr(_parser_local, 'parser', None)
+    if parser is None:
+        parser = _parser_local.parser = simdjson.Parser()
+    document = parser.parse(data)
+    # Materialize the lazy proxy, it becomes invalid once the parser is reused
+    if isinstance(document, simdjson.Object):
+        return document.as_dict()
+    if isinstance(document, simdjson.Array):
+        return document.as_list()
+    return document
+
+def _default(obj):
+    """
+    Serialize model objects (Student, Study_program, Semester, Modul, Grade) by their attributes.
+    
+    Called by the JSON encoder for every object it cannot serialize natively, which lets it walk the live
+    object graph directly instead of a copy built up front with to_dict(). Objects define the attributes
+    to serialize with a _json_fields method, which returns nested objects as they are, so the object graph
+    is only traversed once, by the encoder. The method is deliberately not named __json__, because ujson
+    calls __json__ itself and expects it to return a JSON string.
+    
+    Parameters:
+    - obj: The object to serialize.
+    
+    Returns:
+    - A dictionary of the object's attributes.
+    
+    Raises:
+    - TypeError: If the object has no attributes to serialize.
+    """
+    json_method = getattr(obj, '_json_fields', None)
+    if json_method is not None:
+        return json_method()
+    if dataclasses.is_dataclass(obj):
+        # Slotted dataclasses have no __dict__, read their fields directly without copying nested objects
+        return {field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)}
+    try:
+        return vars(obj)
+    except TypeError:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable") from None
+
+def _dumps_orjson(obj, pretty=False):
+    """
+    Serialize an object to UTF-8 encoded JSON bytes using orjson.
+    
+    Parameters:
+    - obj: The Python object to serialize.
+    - pretty: If True, the output is indented for human editing, otherwise it is written compactly.
+    
+    Returns:
+    - The JSON document as bytes.
+    """
+    # orjson emits UTF-8 natively, so non-ASCII characters are kept as they are
+    return orjson.dumps(obj, default=_default, option=orjson.OPT_INDENT_2 if pretty else 0)
+
+def _dumps_ujson(obj, pretty=False):
+    """
+    Serialize an object to UTF-8 encoded JSON bytes using ujson.
+    
+    Parameters:
+    - obj: The Python object to serialize.
+    - pretty: If True, the output is indented for human editing, otherwise it is written compactly.
+    
+    Returns:
+    - The JSON document as bytes.
+    """
+    return ujson.dumps(obj, default=_default, ensure_ascii=False, escape_forward_slashes=False, indent=4 if pretty else 0).encode('utf-8')
+
+# Encoders of the standard library json module, configured once instead of on every json.dumps call.
+# The compact encoder keeps ASCII escaping so strings go through the C encode_basestring_ascii fast path.
+_JSON_COMPACT_ENCODER = json.JSONEncoder(default=_default, separators=(',', ':'))
+_JSON_PRETTY_ENCODER = json.JSONEncoder(default=_default, ensure_ascii=False, indent=4)
+
+def _dumps_json(obj, pretty=False):
+    """
+    Serialize an object to UTF-8 encoded JSON bytes using the standard library json module.
+    
+    Parameters:
+    - obj: The Python object to serialize.
+    - pretty: If True, the output is indented for human editing, otherwise it is written compactly.
+    
+    Returns:
+    - The JSON document as bytes.
+    """
+    encoder = _JSON_PRETTY_ENCODER if pretty else _JSON_COMPACT_ENCODER
+    return encoder.encode(obj).encode('utf-8')
+
+# Pick the fastest available JSON libraries once at import time: orjson, then ujson, then the standard library.
+# All of them read and return bytes, so the file I/O is the same for every backend.
+if orjson is not None:
+    _dumps = _dumps_orjson
+    _loads = orjson.loads
+    # orjson can parse directly from a memory-mapped buffer without copying the file into a bytes object
+    _ZERO_COPY = True
+elif ujson is not None:
+    _dumps = _dumps_ujson
+    _loads = ujson.loads
+    _ZERO_COPY = False
+else:
+    _dumps = _dumps_json
+    _loads = json.loads
+    _ZERO_COPY = False
+if simdjson is not None:
+    # simdjson only parses, writing stays on the serializer chosen above
+    _loads = _loads_simdjson
+    _ZERO_COPY = False
+
+# Files larger than this are memory-mapped for parsing, smaller ones are cheaper to read in one go
+_MMAP_THRESHOLD = 64 * 1024
+
+# Parsed file contents keyed by absolute path, stored together with the file's (mtime, size) stamp
+_CACHE = {}
+
+def _file_stamp(path):
+    """
+    Get the stamp used to detect whether a file changed since it was last parsed.
+    
+    Parameters:
+    - path: The path to the file.
+    
+    Returns:
+    - A tuple of the file's modification time in nanoseconds and its size in bytes.
+    
+    Raises:
+    - FileNotFoundError: If the file does not exist.
+    """
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+def _read_json(file_path):
+    """
+    Read and parse a JSON file, reusing the previously parsed data if the file has not changed since.
+    
+    Parameters:
+    - file_path: The path to the JSON file.
+    
+    Returns:
+    - The deserialized Python object. Callers must not mutate it, as it is shared with the cache.
+    
+    Raises:
+    - FileNotFoundError: If the file does not exist.
+    """
+    path = os.path.abspath(file_path)
+    stamp = _file_stamp(path)
+    # Return the cached data if the file is unchanged since it was parsed
+    cached = _CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    with open(path, 'rb') as file:
+        if path.endswith('.zst'):
+            # Compressed files are decompressed in memory before parsing
+            data = _loads(_decompress(file.read()))
+        elif _ZERO_COPY and stamp[1] > _MMAP_THRESHOLD:
+            # Let the parser read the page cache directly instead of copying the whole file first
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    data = _loads(view)
+        else:
+            data = _loads(file.read())
+    _CACHE[path] = (stamp, data)
+    return data
+
+def _compress(payload):
+    """
+    Compress a serialized document with zstd for a '.zst' file.
+    
+    Parameters:
+    - payload: The serialized document as bytes.
+    
+    Returns:
+    - The compressed bytes.
+    
+    Raises:
+    - ImportError: If the zstandard package is not installed.
+    """
+    if zstandard is None:
+        raise ImportError("The zstandard package is required to write compressed '.zst' files.")
+    return _ZSTD_COMPRESSOR.compress(payload)
+
+def _decompress(payload):
+    """
+    Decompress the content of a zstd compressed '.zst' file.
+    
+    Parameters:
+    - payload: The compressed bytes.
+    
+    Returns:
+    - The decompressed document as bytes.
+    
+    Raises:
+    - ImportError: If the zstandard package is not installed.
+    """
+    if zstandard is None:
+        raise ImportError("The zstandard package is required to read compressed '.zst' files.")
+    return _ZSTD_DECOMPRESSOR.decompress(payload)
+
+def _invalidate_cache(file_path):
+    """
+    Drop the cached data of a file, e.g. after it has been written.
+    
+    Parameters:
+    - file_path: The path to the JSON file.
+    """
+    _CACHE.pop(os.path.abspath(file_path), None)
+
+# Digest of the content last written by save_student_data and the file's stamp right after, keyed by absolute path
+_LAST_WRITTEN = {}
+
+def _is_unchanged(file_path, digest):
+    """
+    Check whether a file still holds the content with the given digest that was last written to it.
+    
+    Parameters:
+    - file_path: The path to the file.
+    - digest: The digest of the content that is about to be written.
+    
+    Returns:
+    - True if the same content was written last and the file has not been modified since, False otherwise.
+    """
+    path = os.path.abspath(file_path)
+    last = _LAST_WRITTEN.get(path)
+    if last is None or last[1] != digest:
+        return False
+    try:
+        # Only trust the digest while the file is exactly as it was left after the write
+        return _file_stamp(path) == last[0]
+    except FileNotFoundError:
+        return False
+
+# The process umask, read once at import because os.umask can only be read by setting it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+def _write_file(file_path, payload):
+    """
+    Write a serialized document to a file with a single write call.
+    
+    The data is first written and flushed to disk in a temporary file next to the target, which then
+    atomically replaces the target, so a crash while writing never leaves a truncated file behind.
+    
+    Parameters:
+    - file_path: The path to the file to be written.
+    - payload: The complete file content as bytes.
+    """
+    # The temporary file must be on the same file system as the target for os.replace to be atomic
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-', suffix='.tmp')
+    # Hand the descriptor to a file object right away, so it is closed whatever fails afterwards
+    file = os.fdopen(fd, 'wb')
+    try:
+        with file:
+            # mkstemp creates the file owner-only, so give it the permissions the target has or would get from open()
+            try:
+                mode = stat.S_IMODE(os.stat(file_path).st_mode)
+            except FileNotFoundError:
+                mode = 0o666 & ~_UMASK
+            if hasattr(os, 'fchmod'):
+                os.fchmod(file.fileno(), mode)
+            else:  # Windows before Python 3.13
+                os.chmod(temp_path, mode)
+            file.write(payload)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, file_path)
+    except BaseException:
+        # Remove the incomplete temporary file and leave the original file untouched
+        os.remove(temp_path)
+        raise
+    # The cached data no longer matches the file content
+    _invalidate_cache(file_path)
+
+class AutoSaver:
+    """
+    Keeps a file open and overwrites its content in place, for frequent autosaves of the student data.
+    
+    Every save rewrites the file from offset 0 and truncates it to the new length, which avoids opening
+    and closing the file each time. Unlike the default atomic save, a crash during the write can leave
+    an incomplete file, so it should only be used for saves that will soon be repeated.
+    
+    Use it as a context manager, or call close() when done, so the file descriptor is not leaked.
+    """
+    def __init__(self, file_path='student_data.json'):
+        self.file_path = file_path  # The path to the file that is kept open
+        # O_BINARY prevents newline translation on Windows and does not exist on other platforms
+        self.fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | getattr(os, 'O_BINARY', 0), 0o644)
+
+    def save(self, payload):
+        """
+        Replace the content of the file with a serialized document.
+        
+        Parameters:
+        - payload: The complete file content as bytes.
+        """
+        view = memoryview(payload)
+        written = 0
+        while written < len(view):
+            if hasattr(os, 'pwrite'):
+                written += os.pwrite(self.fd, view[written:], written)
+            else:
+                # os.pwrite is not available on Windows, seek to the write position instead
+                os.lseek(self.fd, written, os.SEEK_SET)
+                written += os.write(self.fd, view[written:])
+        # Cut off what remains of a previous, longer content
+        os.ftruncate(self.fd, len(view))
+        # The cached data no longer matches the file content
+        _invalidate_cache(self.file_path)
+
+    def close(self):
+        """
+        Close the file.
+        """
+        os.close(self.fd)
+
+    def __enter__(self):
+        """
+        Use the saver in a with statement.
+        
+        Returns:
+        - The AutoSaver itself.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Close the file when the with statement is left.
+        """
+        self.close()
+
 def load_student_data(file_path='student_data.json'):
     """
     Load student data from a specified JSON file.
     
+    Files with a '.msgpack' extension are read in the binary MessagePack format instead, files with a
+    '.zst' extension (e.g. 'student_data.json.zst') are decompressed with zstd before parsing.
+    
     Parameters:
     - file_path: The path to the JSON file containing the student data.
     
     Returns:
     - An instance of Student initialized with the data from the file.
     """
-    # Open the file and load the JSON data
-    with open(file_path, 'r', encoding='utf-8') as file:
-        data = json.load(file)
-    # Convert the JSON data into a Student object and return it
+    if file_path.endswith('.msgpack'):
+        return load_student_data_bin(file_path)
+    # Load the JSON data, skipping the parse if the file is unchanged
+    data = _read_json(file_path)
+    # Convert the JSON data into a new Student object and return it
     return Student.from_dict(data)
 
-def save_student_data(student, file_path='student_data.json'):
+def save_student_data(student, file_path='student_data.json', pretty=False, saver=None):
     """
     Save a Student object's data to a specified JSON file.
     
     Parameters:
     - student: The Student object to be saved.
     - file_path: The path to the JSON file where the data will be saved.
+    - pretty: If True, the file is indented for human editing, otherwise it is written compactly.
+    - saver: An optional AutoSaver for file_path. If given, the file is overwritten in place through the
+      saver's open file instead of being replaced atomically.
+    
+    Files with a '.msgpack' extension are written in the binary MessagePack format instead, files with a
+    '.zst' extension (e.g. 'student_data.json.zst') are compressed with zstd.
+    
+    Raises:
+    - ValueError: If the saver keeps a different file open than file_path.
     """
-    # Open the file for writing and dump the serialized Student object into it
-    with open(file_path, 'w', encoding='utf-8') as file:
-        json.dump(student.to_dict(), file, ensure_ascii=False, indent=4)
+    if saver is not None and os.path.abspath(saver.file_path) != os.path.abspath(file_path):
+        # Writing through the saver would overwrite another file and record a stamp for file_path it does not have
+        raise ValueError(f"The AutoSaver writes to {saver.file_path!r}, not to {file_path!r}.")
+    if file_path.endswith('.msgpack'):
+        save_student_data_bin(student, file_path)
+        return
+    # Serialize the Student object directly and write it to the file in a single call
+    payload = _dumps(student, pretty)
+    if file_path.endswith('.zst'):
+        payload = _compress(payload)
+    # Skip the write, including its fsync, if the file already holds exactly this content
+    digest = hashlib.blake2b(payload, digest_size=16).digest()
+    if _is_unchanged(file_path, digest):
+        return
+    if saver is not None:
+        saver.save(payload)
+    else:
+        _write_file(file_path, payload)
+    _LAST_WRITTEN[os.path.abspath(file_path)] = (_file_stamp(file_path), digest)
 
-def load_resources(file_path='resources.json'):
+def load_student_data_bin(file_path='student_data.msgpack'):
     """
-    Load resources from a specified JSON file.
+    Load student data from a specified MessagePack file.
+    
+    MessagePack stores numbers and strings length-prefixed in binary form, so the file is smaller than
+    its JSON counterpart and is decoded without scanning text for quotes and escapes.
     
     Parameters:
-    - file_path: The path to the JSON file containing resources data.
+    - file_path: The path to the MessagePack file containing the student data.
     
     Returns:
-    - A list of dictionaries representing the resources, or an empty list if the file is not found.
+    - An instance of Student initialized with the data from the file.
+    
+    Raises:
+    - ImportError: If the msgpack package is not installed.
+    """
+    if msgpack is None:
+        raise ImportError("The msgpack package is required to load binary student data.")
+    with open(file_path, 'rb') as file:
+        data = msgpack.unpackb(file.read(), raw=False)
+    return Student.from_dict(data)
+
+def save_student_data_bin(student, file_path='student_data.msgpack'):
+    """
+    Save a Student object's data to a specified MessagePack file.
+    
+    Parameters:
+    - student: The Student object to be saved.
+    - file_path: The path to the MessagePack file where the data will be saved.
+    
+    Raises:
+    - ImportError: If the msgpack package is not installed.
+    """
+    if msgpack is None:
+        raise ImportError("The msgpack package is required to save binary student data.")
+    # The same default hook as for JSON lets msgpack serialize the Student object directly
+    _write_file(file_path, msgpack.packb(student, default=_default, use_bin_type=True))
+
+def load_all(student_file_path='student_data.json', resources_file_path='resources.jsonl'):
+    """
+    Load the student data and the resources concurrently.
+    
+    Both files are read and parsed in separate threads, so waiting for one file overlaps with parsing
+    the other. The JSON libraries release the GIL while reading and parsing.
+    
+    Parameters:
+    - student_file_path: The path to the file containing the student data.
+    - resources_file_path: The path to the JSON-Lines file containing the resources.
+    
+    Returns:
+    - A tuple of the loaded Student object and the list of resource dictionaries.
+    
+    Raises:
+    - FileNotFoundError: If the student data file does not exist.
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        student_future = executor.submit(load_student_data, student_file_path)
+        resources_future = executor.submit(load_resources, resources_file_path)
+        return student_future.result(), resources_future.result()
+
+# Resource lists staged by stage_resources that still have to be written, keyed by absolute path
+_pending_resources = {}
+# Guards the staged resources, which are written from a timer thread
+_pending_lock = threading.RLock()
+# The timer that writes the staged resources once no further changes arrive
+_flush_timer = None
+# Seconds to wait after the last staged change before the resources are written
+_FLUSH_DELAY = 0.5
+
+def _get_pending_resources(file_path):
+    """
+    Get the resources staged for a file that have not been written yet.
+    
+    Parameters:
+    - file_path: The path to the JSON-Lines resources file.
+    
+    Returns:
+    - The staged list of resources, or None if nothing is pending for the file.
+    """
+    with _pending_lock:
+        return _pending_resources.get(os.path.abspath(file_path))
+
+def stage_resources(resources, file_path='resources.jsonl'):
+    """
+    Stage resources to be saved to a specified JSON-Lines file, coalescing repeated saves into one write.
+    
+    The file is written once no further changes were staged for a short delay, when flush_resources is
+    called, or at the latest when the application exits. Until then, loading the resources returns the
+    staged list.
+    
+    Parameters:
+    - resources: A list of dictionaries representing the resources to be saved.
+    - file_path: The path to the JSON-Lines file where the resources will be saved.
+    """
+    global _flush_timer
+    with _pending_lock:
+        _pending_resources[os.path.abspath(file_path)] = list(resources)
+        # Restart the delay so a burst of changes results in a single write
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+        _flush_timer = threading.Timer(_FLUSH_DELAY, flush_resources)
+        _flush_timer.daemon = True
+        _flush_timer.start()
+
+def flush_resources():
     """
+    Write all resources staged by stage_resources to their files immediately.
+    """
+    global _flush_timer
+    with _pending_lock:
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+            _flush_timer = None
+        for path, resources in list(_pending_resources.items()):
+            save_resources(resources, path)
+
+# Make sure staged resources are not lost when the application exits before the delay has passed
+atexit.register(flush_resources)
+
+def _migrate_resources(file_path):
+    """
+    Convert a resources file from the former JSON format into the JSON-Lines format, once.
+    
+    If the JSON-Lines file does not exist yet but a JSON file with the same base name does
+    (e.g. 'resources.json' for 'resources.jsonl'), its resources are written to the JSON-Lines file.
+    The old file is left in place.
+    
+    Parameters:
+    - file_path: The path to the JSON-Lines resources file.
+    """
+    legacy_path = os.path.splitext(file_path)[0] + '.json'
+    if legacy_path == file_path or os.path.exists(file_path) or not os.path.exists(legacy_path):
+        return
+    save_resources(_read_json(legacy_path)['resources'], file_path)
+
+def _intern_strings(value):
+    """
+    Replace all strings in parsed JSON data by their interned counterparts.
+    
+    The parser creates a new string object for every occurrence of a value, interning makes equal
+    strings share one object, which reduces the memory used by resources with repeated values.
     
+    Parameters:
+    - value: The parsed JSON data (a dictionary, list, string or other scalar).
+    
+    Returns:
+    - The same data with all strings interned.
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, dict):
+        return {sys.intern(key): _intern_strings(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_intern_strings(item) for item in value]
+    return value
+
+def iter_resources(file_path='resources.jsonl'):
+    """
+    Lazily iterate over the resources in a specified JSON-Lines file.
+    
+    Each line is only parsed when the iteration reaches it, so callers that stop early skip the
+    rest of the file. A complete iteration caches the parsed resources until the file changes.
+    Malformed lines, e.g. left behind by an interrupted append, are skipped with a warning.
+    
+    Parameters:
+    - file_path: The path to the JSON-Lines file containing resources data, one resource per line.
+    
+    Yields:
+    - A dictionary representing a resource. Nothing is yielded if the file is not found.
+    """
+    # Resources staged for writing are newer than the file content
+    pending = _get_pending_resources(file_path)
+    if pending is not None:
+        for resource in pending:
+            yield dict(resource)
+        return
+    _migrate_resources(file_path)
+    path = os.path.abspath(file_path)
     try:
-        # Attempt to open the file and load the JSON data
-        with open(file_path, 'r', encoding='utf-8') as file:
-            data = json.load(file)
-        return data['resources']
+        stamp = _file_stamp(path)
     except FileNotFoundError:
-        # Return an empty list if the file does not exist
-        return []
+        # A missing file simply contains no resources
+        return
+    # Yield copies so callers can modify the resources without touching the cache
+    cached = _CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        for resource in cached[1]:
+            yield dict(resource)
+        return
+    # The parser is bound to a local name and blank lines are detected without creating
+    # stripped copies, keeping the per-line interpreter overhead low
+    loads = _loads
+    resources = []
+    with open(path, 'rb') as file:
+        for line_number, line in enumerate(file, start=1):
+            if line.isspace():
+                continue
+            try:
+                # All supported parsers validate the line before building any objects from it
+                resource = loads(line)
+            except ValueError:
+                resource = None
+            if not isinstance(resource, dict) or 'name' not in resource or 'url' not in resource:
+                warnings.warn(f"Skipping malformed resource in {file_path}, line {line_number}.")
+                continue
+            # Repeated strings (e.g. keys, tags or categories) share a single object in memory
+            resource = _intern_strings(resource)
+            resources.append(resource)
+            yield dict(resource)
+    _CACHE[path] = (stamp, resources)
 
-def save_resources(resources, file_path='resources.json'):
+def load_resources(file_path='resources.jsonl'):
     """
-    Save resources to a specified JSON file.
+    Load resources from a specified JSON-Lines file.
+    
+    Parameters:
+    - file_path: The path to the JSON-Lines file containing resources data, one resource per line.
+    
+    Returns:
+    - A list of dictionaries representing the resources, or an empty list if the file is not found.
+    """
+    return list(iter_resources(file_path))
+
+def save_resources(resources, file_path='resources.jsonl'):
+    """
+    Save resources to a specified JSON-Lines file, replacing its content.
     
     Parameters:
     - resources: A list of dictionaries representing the resources to be saved.
-    - file_path: The path to the JSON file where the resources will be saved.
+    - file_path: The path to the JSON-Lines file where the resources will be saved.
+    """
+    with _pending_lock:
+        # Resources staged for the same file are superseded by this write
+        _pending_resources.pop(os.path.abspath(file_path), None)
+    # Serialize each resource onto its own line and write the file in a single call
+    _write_file(file_path, b''.join(_dumps(resource) + b'\n' for resource in resources))
+
+def save_resources_append(resource, file_path='resources.jsonl'):
+    """
+    Append a single resource to a specified JSON-Lines file without rewriting the existing resources.
+    
+    Parameters:
+    - resource: A dictionary representing the resource to be added.
+    - file_path: The path to the JSON-Lines file where the resource will be appended.
     """
-    # Open the file for writing and dump the resources list into it
-    with open(file_path, 'w', encoding='utf-8') as file:
-        json.dump({'resources': resources}, file, ensure_ascii=False, indent=4)
+    with _pending_lock:
+        # If a rewrite of the file is staged, add the resource to it instead, it is written with the next flush
+        pending = _get_pending_resources(file_path)
+        if pending is not None:
+            pending.append(resource)
+            return
+    _migrate_resources(file_path)
+    payload = _dumps(resource) + b'\n'
+    with open(file_path, 'a+b') as file:
+        # Start on a new line if the last line was cut off, so the new resource is not merged into it
+        if file.seek(0, os.SEEK_END) > 0:
+            file.seek(-1, os.SEEK_END)
+            if file.read(1) != b'\n':
+                payload = b'\n' + payload
+        file.write(payload)
+    # The cached data no longer matches the file content
+    _invalidate_cache(file_path)
@@ -1,8 +1,127 @@
 import tkinter as tk
+from dataclasses import dataclass
 from tkinter import ttk, messagebox, simpledialog
 from PIL import Image, ImageTk
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
+
+# Treeview tags for the status of a module
+PASSED, FAILED, NO_GRADE = 'passed', 'failed', 'no_grade'
+
+def _tag_for(module):
+    """
+    Determines the Treeview tag of a module based on its grade.
+
+    Parameters:
+    - module: The module to classify.
+
+    Returns:
+    - PASSED for accepted modules and grades up to 4.0, FAILED for worse grades, NO_GRADE otherwise.
+    """
+    g = module.grade
+    if g is None:
+        return NO_GRADE
+    v = g.grade
+    # Exact type checks are cheaper than isinstance and cover the grades loaded from JSON
+    if type(v) is float or type(v) is int:
+        return PASSED if v <= 4.0 else FAILED
+    if type(v) is str and v.lower() == 'a':
+        return PASSED  # Accepted
+    return NO_GRADE
+
+@dataclass
+class ModuleInput:
+    """
+    The values entered in the add module form.
+    """
+    semester_number: int  # The semester the module belongs to
+    name: str  # Name of the module
+    credits: int  # Number of credits of the module
+    exam_type: str  # Type of exam for the module
+    grade_str: str  # The grade as entered, empty if not available
+
+class AddModuleDialog(tk.Toplevel):
+    """
+    A modal form with all fields needed to add a module, submitted together.
+    """
+    def __init__(self, parent, submit):
+        """
+        Creates the form on top of its parent window.
+
+        Parameters:
+        - parent: The window the form belongs to.
+        - submit: Called with a ModuleInput when the form is confirmed. Returns a (success, message) tuple;
+          the form stays open and shows the message if it was not successful.
+        """
+        super().__init__(parent)
+        self.title("Add Module")
+        self.transient(parent)
+        self.resizable(False, False)
+        self.submit = submit
+        self.result = None  # The submitted ModuleInput, None if the form was canceled
+
+        # Create and place a label and an entry for each field, one per row
+        fields = [
+            ("Semester number:", 'semester_number'),
+            ("Module name:", 'name'),
+            ("Credits:", 'credits'),
+            ("Exam type:", 'exam_type'),
+            ("Grade (leave blank if not available):", 'grade_str'),
+        ]
+        self.vars = {}
+        for row, (label, key) in enumerate(fields):
+            tk.Label(self, text=label).grid(row=row, column=0, sticky="w", padx=5, pady=2)
+            self.vars[key] = tk.StringVar()
+            entry = tk.Entry(self, textvariable=self.vars[key])
+            entry.grid(row=row, column=1, sticky="ew", padx=5, pady=2)
+            if row == 0:
+                entry.focus_set()  # Start with the semester number
+
+        # Add the OK and Cancel buttons below the fields
+        buttons = tk.Frame(self)
+        buttons.grid(row=len(fields), column=0, columnspan=2, pady=5)
+        tk.Button(buttons, text="OK", width=10, command=self.on_ok).pack(side="left", padx=5)
+        tk.Button(buttons, text="Cancel", width=10, command=self.destroy).pack(side="left", padx=5)
+        self.bind('<Return>', lambda event: self.on_ok())
+        self.bind('<Escape>', lambda event: self.destroy())
+
+    def on_ok(self):
+        """
+        Validates the entered values and submits them. Closes the form if the submission succeeded.
+        """
+        try:
+            semester_number = int(self.vars['semester_number'].get())
+            credits = int(self.vars['credits'].get())
+        except ValueError:
+            messagebox.showerror("Error", "Semester number and credits must be whole numbers.", parent=self)
+            return
+        name = self.vars['name'].get().strip()
+        if not name:  # Validate module name is not empty
+            messagebox.showerror("Error", "Module name cannot be empty.", parent=self)
+            return
+        exam_type = self.vars['exam_type'].get().strip()
+        if not exam_type:  # Validate exam type is not empty
+            messagebox.showerror("Error", "Exam type cannot be empty.", parent=self)
+            return
+
+        values = ModuleInput(semester_number, name, credits, exam_type, self.vars['grade_str'].get())
+        success, message = self.submit(values)
+        if not success:
+            messagebox.showerror("Error", message, parent=self)  # Display specific error, the values stay for correction
+            return
+        self.result = values
+        self.destroy()
+
+    def show(self):
+        """
+        Makes the form modal and waits until it is closed.
+
+        Returns:
+        - The submitted ModuleInput, or None if the form was canceled.
+        """
+        # A grab on a window that is not mapped yet fails on X11, so wait until it is shown like simpledialog does
+        self.wait_visibility()
+        self.grab_set()  # Make the form modal
+        self.wait_window()
+        return self.result
 
 class GUI:
     """
@@ -12,6 +131,11 @@ class GUI:
     The class organizes the application's UI into frames for student information, module management, and resources, offering functionalities 
     such as adding, editing, and deleting modules and resources, updating student information, and visualizing academic progress.
     """
+    _ICONS = None  # Scaled icons shared by all GUI instances, keyed by name
+    _ICONS_ROOT = None  # The Tk root the cached icons belong to
+    _MODULE_ROWS_VISIBLE = 25  # Height of the modules Treeview, only this many rows are inserted at once
+    _MODULE_SCROLL_STEP = 3  # Rows moved per mouse wheel notch
+
     def __init__(self, root, logic):
         """
         Initializes the Student Dashboard GUI.
@@ -23,59 +147,86 @@ class GUI:
         self.root = root
         self.logic = logic
         self.module_tree_id_to_module_id = {} 
+        self._module_row_cache = {}  # Maps module IDs to their treeview ID and the displayed values and tag
+        self._all_module_rows = []  # (module ID, values, tag) of every module, in display order
+        self._module_first_row = 0  # Index of the first module row shown in the treeview
+        self._module_row_index = {}  # Maps module IDs to their index in '_all_module_rows'
+        self._selected_module_id = None  # The selected module, kept while its row is scrolled out of the treeview
+        self._editing = False  # Whether the student information entries are currently editable
+        self._resources_version_seen = None  # Version of the resources shown in the listbox
         self.root.title("Student Dashboard")
         self.root.grid_columnconfigure(0, weight=1)
         self.root.grid_columnconfigure(1, weight=0)
         self.root.resizable(False, False)
         
-        self.load_icons()  # Load UI icons
+        self.load_icons(self.root)  # Load UI icons
         self.setup_ui()    # Setup UI components
 
-    def load_icons(self):
-        """Loads and scales icons for the application."""
-        edit_image = Image.open("icons/edit_icon.png")
-        save_image = Image.open("icons/save_icon.png")
-        plus_image = Image.open("icons/plus_icon.png")
-        minus_image = Image.open("icons/minus_icon.png")
-        
-        self.edit_icon = ImageTk.PhotoImage(edit_image.resize((16, 16), Image.Resampling.LANCZOS))
-        self.save_icon = ImageTk.PhotoImage(save_image.resize((16, 16), Image.Resampling.LANCZOS))
-        self.plus_icon = ImageTk.PhotoImage(plus_image.resize((16, 16), Image.Resampling.LANCZOS))
-        self.minus_icon = ImageTk.PhotoImage(minus_image.resize((16, 16), Image.Resampling.LANCZOS))
+    @classmethod
+    def load_icons(cls, root):
+        """
+        Loads and scales icons for the application.
+        The icons are decoded once per Tk root and shared by all GUI instances as class attributes.
+
+        Parameters:
+        - root: The root Tkinter window the icons are created for.
+        """
+        # A PhotoImage belongs to one Tk interpreter, so only reuse the cache for the same root
+        if cls._ICONS is not None and cls._ICONS_ROOT is root:
+            return
+        # Bilinear resampling is much cheaper than Lanczos and looks the same at 16x16
+        cls._ICONS = {
+            name: ImageTk.PhotoImage(Image.open(f"icons/{name}_icon.png").resize((16, 16), Image.Resampling.BILINEAR), master=root)
+            for name in ('edit', 'save', 'plus', 'minus')
+        }
+        cls._ICONS_ROOT = root
+        cls.edit_icon = cls._ICONS['edit']
+        cls.save_icon = cls._ICONS['save']
+        cls.plus_icon = cls._ICONS['plus']
+        cls.minus_icon = cls._ICONS['minus']
 
     def setup_ui(self):
-        """Sets up UI components."""
-        self.create_student_info_frame()
-        self.create_progress_frame()
-        self.create_modules_frame()
-        self.create_resources_frame()
-        self.refresh_progress_frame()
+        """
+        Sets up UI components.
+        The window stays hidden while the frames are built, so the layout is computed once when it is shown.
+        """
+        self.root.withdraw()
+        try:
+            self.create_student_info_frame()
+            self.create_progress_frame()
+            self.create_modules_frame()
+            self.create_resources_frame()
+            self.refresh_progress_frame()
+        finally:
+            # Lay out all widgets in a single pass before showing the window again
+            self.root.update_idletasks()
+            self.root.deiconify()
 
     def toggle_edit(self):
         """
         Toggles the editability of the student information entries, allowing the user to update their information.
         Switches the icon of the edit button to indicate the current mode (edit or save).
         """
-        if self.edit_button.cget('image') == str(self.edit_icon):
-            # Enable text entry fields for editing
-            self.name_entry.config(state=tk.NORMAL)
-            self.matriculation_number_entry.config(state=tk.NORMAL)
-            self.study_program_entry.config(state=tk.NORMAL)
-            self.study_goal_entry.config(state=tk.NORMAL)
-            self.edit_button.config(image=self.save_icon)
-        else:
-            # Disable text entry fields to prevent editing
-            self.name_entry.config(state=tk.DISABLED)
-            self.matriculation_number_entry.config(state=tk.DISABLED)
-            self.study_program_entry.config(state=tk.DISABLED)
-            self.study_goal_entry.config(state=tk.DISABLED)
-            self.edit_button.config(image=self.edit_icon)
+        if self._editing:
+            # Validate the study goal before leaving edit mode
+            try:
+                study_goal = float(self.study_goal_var.get())  # Ensuring study_goal is a float
+            except ValueError:
+                messagebox.showerror("Invalid Input", "The study goal must be a number.")
+                return
+
+        self._editing = not self._editing
+        self.edit_button.config(image=self.save_icon if self._editing else self.edit_icon)
+        # Enable the text entry fields for editing or disable them to prevent editing
+        state = tk.NORMAL if self._editing else tk.DISABLED
+        for entry in self._entries:
+            entry.config(state=state)
 
+        if not self._editing:
             # Collect edited values from entry fields
             name = self.name_var.get()
             matriculation_number = self.matriculation_number_var.get()
             study_program = self.study_program_var.get()
-            study_goal = float(self.study_goal_var.get())  # Ensuring study_goal is a float
 
             # Call logic function to update and save the student data
             self.logic.update_student_info(name, matriculation_number, study_program, study_goal)
@@ -105,25 +256,20 @@ class GUI:
         self.study_program_var = tk.StringVar(value=student_info.get("study_program", ""))
         self.study_goal_var = tk.StringVar(value=str(student_info.get("study_goal", "")))  # Converting study_goal to string
 
-        # Create and place the 'Name' label and entry
-        tk.Label(frame, text="Name:").grid(row=0, column=0, sticky="w")
-        self.name_entry = tk.Entry(frame, textvariable=self.name_var, state='readonly')
-        self.name_entry.grid(row=0, column=1, sticky="w")
-
-        # Create and place the 'Matriculation Number' label and entry
-        tk.Label(frame, text="Matriculation Number:").grid(row=1, column=0, sticky="w")
-        self.matriculation_number_entry = tk.Entry(frame, textvariable=self.matriculation_number_var, state='readonly')
-        self.matriculation_number_entry.grid(row=1, column=1, sticky="w")
-
-        # Create and place the 'Study Program' label and entry
-        tk.Label(frame, text="Study Program:").grid(row=2, column=0, sticky="w")
-        self.study_program_entry = tk.Entry(frame, textvariable=self.study_program_var, state='readonly')
-        self.study_program_entry.grid(row=2, column=1, sticky="w")
-
-        # Create and place the 'Study Goal' label and entry
-        tk.Label(frame, text="Study Goal:").grid(row=3, column=0, sticky="w")
-        self.study_goal_entry = tk.Entry(frame, textvariable=self.study_goal_var, state='readonly')
-        self.study_goal_entry.grid(row=3, column=1, sticky="w")
+        # Create and place a label and an entry for each field, one per row
+        fields = [
+            ("Name:", self.name_var, 'name_entry'),
+            ("Matriculation Number:", self.matriculation_number_var, 'matriculation_number_entry'),
+            ("Study Program:", self.study_program_var, 'study_program_entry'),
+            ("Study Goal:", self.study_goal_var, 'study_goal_entry'),
+        ]
+        self._entries = []  # The entries toggled by the edit button
+        for row, (label, var, attr) in enumerate(fields):
+            tk.Label(frame, text=label).grid(row=row, column=0, sticky="w")
+            entry = tk.Entry(frame, textvariable=var, state='readonly')
+            entry.grid(row=row, column=1, sticky="w")
+            setattr(self, attr, entry)
+            self._entries.append(entry)
 
         # Add the Edit button to enable editing of the student information
         self.edit_button = tk.Button(frame, image=self.edit_icon, command=self.toggle_edit)
@@ -151,6 +297,29 @@ class GUI:
         self.progress_frame.grid_columnconfigure(0, minsize=50)
         self.progress_frame.grid_columnconfigure(1, minsize=50)  # Reserved for the pie chart
 
+        # Create the labels once, refreshing only updates the variables bound to them
+        self.credits_var, self.progress_var, self.goal_var, self.avg_grade_var = (tk.StringVar() for _ in range(4))
+        tk.Label(self.progress_frame, textvariable=self.credits_var).grid(row=0, column=0, sticky="w")
+        tk.Label(self.progress_frame, textvariable=self.progress_var).grid(row=1, column=0, sticky="w", pady=2)
+        tk.Label(self.progress_frame, textvariable=self.goal_var).grid(row=2, column=0, sticky="w", pady=2)
+        # Keep a reference to the average grade label to update its background color
+        self.avg_grade_label = tk.Label(self.progress_frame, textvariable=self.avg_grade_var, fg='white')
+        self.avg_grade_label.grid(row=3, column=0, sticky="w", pady=2)
+
+        # Create the pie chart once, refreshing only changes the extent of its two wedges
+        self.pie_canvas = tk.Canvas(self.progress_frame, width=100, height=100, highlightthickness=0)
+        self.pie_canvas.grid(row=0, column=1, rowspan=4, sticky="nswe", padx=5)
+        self.pie_done = self.pie_canvas.create_arc(2, 2, 98, 98, start=90, extent=0, fill='#4CAF50', outline='')
+        self.pie_rest = self.pie_canvas.create_arc(2, 2, 98, 98, start=90, extent=0, fill='#FFC107', outline='')
+
+        # Configure the row and column sizes for proper alignment
+        self.progress_frame.grid_rowconfigure(0, weight=0, pad=0)
+        self.progress_frame.grid_rowconfigure(1, weight=0, pad=0)
+        self.progress_frame.grid_rowconfigure(2, weight=0, pad=0)
+        self.progress_frame.grid_rowconfigure(3, weight=0, pad=0)
+        self.progress_frame.grid_columnconfigure(0, weight=1)
+        self.progress_frame.grid_columnconfigure(1, weight=2)
+
         self.refresh_progress_frame() # Calls to initially populate the frame with data
 
     def create_resources_frame(self):
@@ -164,6 +333,24 @@ class GUI:
         # Initialize the frame for resources within the main window
         self.resources_frame = tk.LabelFrame(self.root, text="Resources")
         self.resources_frame.grid(row=0, column=2, sticky="nsew", padx=10, pady=5)
+
+        # Create the listbox widget for displaying the names of resources
+        self.resources_listbox = tk.Listbox(self.resources_frame, height=4)
+        self.resources_listbox.grid(row=0, column=0, rowspan=2, sticky="nsew")
+        # Bind a double-click event to the listbox to open the selected resource
+        self.resources_listbox.bind('<Double-1>', self.on_resource_double_click)
+
+        # Adding scrollbar to the listbox
+        self.resources_scrollbar = tk.Scrollbar(self.resources_frame, orient="vertical", command=self.resources_listbox.yview)
+        self.resources_scrollbar.grid(row=0, column=1, rowspan=2, sticky='nsew')
+        # Set the listbox's yscrollcommand to the scrollbar's set command
+        self.resources_listbox.config(yscrollcommand=self.resources_scrollbar.set)
+
+        # Configure the grid layout to allocate space for the scrollbar
+        self.resources_frame.grid_columnconfigure(0, weight=1)
+        self.resources_frame.grid_rowconfigure(0, weight=1)  # Add button row
+        self.resources_frame.grid_rowconfigure(1, weight=1)  # Delete button row
+
         self.populate_resources_listbox()
 
         # Initialize and place the Add Resource button
@@ -174,9 +361,6 @@ class GUI:
         self.delete_button = tk.Button(self.resources_frame, image=self.minus_icon, command=self.delete_resource_dialog)
         self.delete_button.grid(row=1, column=2, padx=1, pady=1, sticky="nsew")
 
-        # Ensure the resources listbox spans the necessary grid area
-        self.resources_listbox.grid(row=0, column=0, rowspan=2, sticky="nsew")
-
     def create_modules_frame(self):
         """
         Creates and arranges the modules frame in the GUI.
@@ -191,8 +375,11 @@ class GUI:
 
         # Define the columns for the Treeview widget and configure their properties
         columns = ("Module", "Semester", "Credits", "Exam Type", "Grade")
-        self.modules_tree = ttk.Treeview(frame, columns=columns, show="headings", height=25)
+        self.modules_tree = ttk.Treeview(frame, columns=columns, show="headings", height=self._MODULE_ROWS_VISIBLE, selectmode="browse")
         self.modules_tree.grid(row=0, column=0, rowspan=3, sticky="nsew")
+        # The treeview only holds the visible rows, so the scrollbar is driven by the window position instead
+        self.modules_scrollbar = ttk.Scrollbar(frame, orient="vertical", command=self.on_modules_scrollbar)
+        self.modules_scrollbar.grid(row=0, column=1, rowspan=3, sticky="ns")
 
         # Configure each column's heading and width
         column_widths = {'Module': 450, 'Semester': 70, 'Credits': 70, 'Exam Type': 70, 'Grade': 70}
@@ -200,18 +387,32 @@ class GUI:
             self.modules_tree.heading(col, text=col.title())
             self.modules_tree.column(col, width=column_widths[col], anchor='center')
 
+        # Only the visible rows are in the treeview, so scrolling moves that window over all module rows
+        self.modules_tree.bind('<MouseWheel>', self.on_modules_tree_scroll)
+        self.modules_tree.bind('<Button-4>', self.on_modules_tree_scroll)  # Wheel up on X11
+        self.modules_tree.bind('<Button-5>', self.on_modules_tree_scroll)  # Wheel down on X11
+        # The treeview's own key bindings stop at the edge of the window, so the selection is moved over all rows
+        self.modules_tree.bind('<Up>', lambda event: self.move_module_selection(-1))
+        self.modules_tree.bind('<Down>', lambda event: self.move_module_selection(1))
+        self.modules_tree.bind('<Prior>', lambda event: self.move_module_selection(-self._MODULE_ROWS_VISIBLE))
+        self.modules_tree.bind('<Next>', lambda event: self.move_module_selection(self._MODULE_ROWS_VISIBLE))
+        self.modules_tree.bind('<<TreeviewSelect>>', self.on_modules_tree_select)
+
+        # Define tags for color-coding module entries based on their status
+        self.modules_tree.tag_configure(PASSED, background='#A2D5AB')  # Green
+        self.modules_tree.tag_configure(FAILED, background='#FFC0CB')  # Red
+        self.modules_tree.tag_configure(NO_GRADE, background='#D3D3D3')  # Light grey
+
         # Initialize and place buttons for module management
-        ttk.Button(frame, image=self.plus_icon, command=self.add_module_dialog).grid(row=1, column=1, padx=5, pady=5, sticky="nsew")
-        ttk.Button(frame, image=self.edit_icon, command=self.edit_selected_module_grade).grid(row=0, column=1, padx=5, pady=5, sticky="nsew")
-        ttk.Button(frame, image=self.minus_icon, command=self.delete_selected_module).grid(row=2, column=1, padx=5, pady=5, sticky="nsew")
+        ttk.Button(frame, image=self.plus_icon, command=self.add_module_dialog).grid(row=1, column=2, padx=5, pady=5, sticky="nsew")
+        ttk.Button(frame, image=self.edit_icon, command=self.edit_selected_module_grade).grid(row=0, column=2, padx=5, pady=5, sticky="nsew")
+        ttk.Button(frame, image=self.minus_icon, command=self.delete_selected_module).grid(row=2, column=2, padx=5, pady=5, sticky="nsew")
         self.populate_modules_tree()  # Load and display the list of modules
 
-        # Adjust the treeview to span the columns of the buttons
-        self.modules_tree.grid(row=0, column=0, sticky="nsew")
-
         # Configure the layout to allocate space appropriately
         frame.grid_columnconfigure(0, weight=1)
         frame.grid_columnconfigure(1, weight=0)
+        frame.grid_columnconfigure(2, weight=0)
         frame.grid_rowconfigure(0, weight=1)
         frame.grid_rowconfigure(1, weight=1)
         frame.grid_rowconfigure(2, weight=1)
@@ -222,144 +423,236 @@ class GUI:
         Displays the student's credits, progress percentage, study goal, and average grade.
         Also updates the pie chart visualization of the progress.
         """
-         # Clear existing content
-        for widget in self.progress_frame.winfo_children():
-            widget.destroy()
-
-        # Calculate the total and current credits
-        total_credits = self.logic.get_total_credits()
-        current_credits = self.logic.get_completed_credits()
-
-        # Use the logic instance to calculate progress and average grade
-        progress = self.logic.calculate_progress()
-        average_grade = self.logic.calculate_average_grade()
+        # Get all progress metrics from the logic layer at once
+        snapshot = self.logic.get_progress_snapshot()
+        total_credits = snapshot.total_credits
+        current_credits = snapshot.completed_credits
+        progress = snapshot.progress
+        average_grade = snapshot.average_grade
 
         # Display credits
-        tk.Label(self.progress_frame, text=f"Credits: {current_credits}/{total_credits}").grid(row=0, column=0, sticky="w")
+        self.credits_var.set(f"Credits: {current_credits}/{total_credits}")
 
         # Display the progress
-        tk.Label(self.progress_frame, text=f"Progress: {progress:.2f}%").grid(row=1, column=0, sticky="w", pady=2)
+        self.progress_var.set(f"Progress: {progress:.2f}%")
         
         # Display the study goal with renamed label
-        tk.Label(self.progress_frame, text=f"Study Goal: {self.study_goal_var.get()}").grid(row=2, column=0, sticky="w", pady=2)
+        goal = snapshot.study_goal
+        self.goal_var.set(f"Study Goal: {goal}")
         
         # Correctly handling the display and background color for average_grade
-        goal = float(self.study_goal_var.get())  # Assumed this value is already validated
-        if average_grade != "N/A":
+        if average_grade is not None:
             try:
                 avg_grade_value = float(average_grade)
                 avg_grade_text = f"Current Grade Average: {avg_grade_value:.2f}"
-                bg_color = 'green' if avg_grade_value <= goal else 'red'
+                bg_color, fg_color = ('green' if avg_grade_value <= goal else 'red'), 'white'
             except ValueError:
                 avg_grade_text = "Current Grade Average: Error"  # Handle unexpected error
-                bg_color = 'red'
+                bg_color, fg_color = 'red', 'white'
         else:
+            # No graded modules yet, the logic layer returns None in that case
             avg_grade_text = "Current Grade Average: N/A"
-            bg_color = 'white'  # or any neutral color if average_grade is "N/A"
-
-        avg_grade_label = tk.Label(self.progress_frame, text=avg_grade_text, bg=bg_color, fg='white')
-        avg_grade_label.grid(row=3, column=0, sticky="w", pady=2)
+            bg_color, fg_color = 'white', 'black'  # Neutral colors, the text stays readable
 
-        # Add pie chart visualization for progress
-        figure = plt.Figure(figsize=(1, 1), dpi=100)
-        figure.subplots_adjust(left=0, right=1, top=1, bottom=0)
-        ax = figure.add_subplot(111)
-        ax.pie([progress, 100 - progress], startangle=90, colors=['#4CAF50', '#FFC107'])
-        ax.axis('equal')
-        canvas = FigureCanvasTkAgg(figure, master=self.progress_frame)
-        canvas_widget = canvas.get_tk_widget()
-        canvas_widget.grid(row=0, column=1, rowspan=4, sticky="nswe", padx=5)
+        self.avg_grade_var.set(avg_grade_text)
+        self.avg_grade_label.configure(bg=bg_color, fg=fg_color)
 
-        # Configure the row and column sizes for proper alignment
-        self.progress_frame.grid_rowconfigure(0, weight=0, pad=0)
-        self.progress_frame.grid_rowconfigure(1, weight=0, pad=0)
-        self.progress_frame.grid_rowconfigure(2, weight=0, pad=0)
-        self.progress_frame.grid_rowconfigure(3, weight=0, pad=0)
-        self.progress_frame.grid_columnconfigure(0, weight=1)
-        self.progress_frame.grid_columnconfigure(1, weight=2)
+        # Update the pie chart wedges, drawn counter-clockwise from the top like matplotlib's pie with startangle=90
+        done_extent = max(0, min(progress, 100)) * 3.6
+        # Tk draws nothing for an extent of a full 360 degrees, so a full circle is drawn just short of it
+        self.pie_canvas.itemconfig(self.pie_done, extent=min(done_extent, 359.999))
+        self.pie_canvas.itemconfig(self.pie_rest, start=90 + done_extent, extent=min(360 - done_extent, 359.999))
 
     def populate_resources_listbox(self):
         """
         Populates the listbox in the resources frame with resource names.
         This method fetches resource information through the logic layer and displays each resource's name
         in the listbox widget for easy access. Double-clicking a resource name will open its URL in the web browser.
-        It also configures a scrollbar for the listbox.
+        The listbox is reused; only its entries are replaced, and only if the resources changed since the last call.
         """
-        # If an existing listbox widget is present, destroy it to refresh the contents
-        if hasattr(self, 'resources_listbox'):
-            self.resources_listbox.destroy()
+        # Nothing to do if the listbox already shows the current resources
+        version = self.logic.get_resources_version()
+        if version == self._resources_version_seen:
+            return
+        self._resources_version_seen = version
 
-        # Create a new listbox widget for displaying the names of resources
-        self.resources_listbox = tk.Listbox(self.resources_frame, height=4)
-        self.resources_listbox.grid(row=0, column=0, rowspan=2, sticky="nsew")
-        # Bind a double-click event to the listbox to open the selected resource
-        self.resources_listbox.bind('<Double-1>', self.on_resource_double_click)
+        # Clear the existing entries in the listbox
+        self.resources_listbox.delete(0, tk.END)
 
         # Use the logic class to load resource names
         resources = self.logic.get_resources()
-        for resource in resources:
-            self.resources_listbox.insert(tk.END, resource['name'])
+        # Insert all names in one call instead of one Tcl round-trip per resource
+        self.resources_listbox.insert(tk.END, *[resource['name'] for resource in resources])
 
-        # Configure the grid layout to allocate space for the scrollbar
-        self.resources_frame.grid_columnconfigure(0, weight=1)
-        self.resources_frame.grid_rowconfigure(0, weight=1)  # Listbox row
-        self.resources_frame.grid_rowconfigure(0, weight=1)  # Add button row
-        self.resources_frame.grid_rowconfigure(1, weight=1)  # Delete button row
+    def populate_modules_tree(self):
+        """
+        Populates the treeview widget in the modules frame with module information.
+        It displays each module's name, semester number, credits, exam type, and grade.
+        Modules are tagged with different colors based on their status (e.g., passed, failed, no grade).
+        This method also maintains a mapping between treeview item IDs and module IDs for easy management.
+        Only the rows in the visible window are kept in the treeview, see 'render_module_rows'.
+        """
+        # Iterate through each semester and module to collect the rows to display, in display order
+        rows = []
+        for semester_number, module in self.logic.iter_modules():
+            # Determine the module's grade or use "N/A" if no grade is available
+            grade = module.grade.grade if module.grade else "N/A"
+            # Determine the appropriate tag based on the module's status
+            rows.append((module.id, (module.name, semester_number, module.credits, module.exam_type, grade), _tag_for(module)))
+        self._all_module_rows = rows
+        self._module_row_index = {row[0]: index for index, row in enumerate(rows)}
+
+        self.render_module_rows()
+        # Refresh the module frame with new information
+        self.refresh_progress_frame()
 
-        # Adding scrollbar to the listbox
-        scrollbar = tk.Scrollbar(self.resources_frame, orient="vertical")
-        scrollbar.grid(row=0, column=1, rowspan=2, sticky='nsew')
+    def render_module_rows(self):
+        """
+        Shows the window of module rows starting at '_module_first_row' in the treeview.
+        Only rows that changed since the last call are inserted, updated or deleted.
+        """
+        # Keep the window within the rows, e.g. after modules were deleted
+        visible = self._MODULE_ROWS_VISIBLE
+        first = max(0, min(self._module_first_row, len(self._all_module_rows) - visible))
+        self._module_first_row = first
+        rows = self._all_module_rows[first:first + visible]
+        total = len(self._all_module_rows)
+        self.modules_scrollbar.set(first / total if total else 0.0, (first + len(rows)) / total if total else 1.0)
+        if self._selected_module_id not in self._module_row_index:
+            self._selected_module_id = None  # The selected module was deleted
+
+        # Find the rows of modules that no longer exist and the rows that are new or changed
+        current_ids = {module_id for module_id, _, _ in rows}
+        removed = [module_id for module_id in self._module_row_cache if module_id not in current_ids]
+        changed = [(index, row) for index, row in enumerate(rows)
+                   if self._module_row_cache.get(row[0], (None,))[1:] != row[1:]]
+
+        if removed or changed:
+            # Hide the columns while the rows change so Tk lays out the tree once instead of after every row
+            self.modules_tree.configure(displaycolumns=())
+            try:
+                # Delete the rows of modules that no longer exist
+                for module_id in removed:
+                    tree_id = self._module_row_cache.pop(module_id)[0]
+                    self.modules_tree.delete(tree_id)
+                    del self.module_tree_id_to_module_id[tree_id]
+
+                # Insert new rows at their position and update rows whose values or tag changed.
+                # Modules keep their relative order, so existing rows never have to be moved.
+                for index, (module_id, values, tag) in changed:
+                    cached = self._module_row_cache.get(module_id)
+                    if cached is None:
+                        # Insert the values into the tree with the appropriate tag
+                        tree_id = self.modules_tree.insert("", index, values=values, tags=(tag,))
+                        # Update the mapping with the new Treeview ID and module ID
+                        self.module_tree_id_to_module_id[tree_id] = module_id
+                    else:
+                        tree_id = cached[0]
+                        self.modules_tree.item(tree_id, values=values, tags=(tag,))
+                    self._module_row_cache[module_id] = (tree_id, values, tag)
+            finally:
+                self.modules_tree.configure(displaycolumns="#all")
 
-        # Set the listbox's yscrollcommand to the scrollbar's set command
-        self.resources_listbox.config(yscrollcommand=scrollbar.set)
+        # Select the row of the selected module again when it is scrolled back into the window
+        cached = self._module_row_cache.get(self._selected_module_id)
+        if cached is not None and self.modules_tree.selection() != (cached[0],):
+            self.modules_tree.selection_set(cached[0])
 
-        self.configure_resources_listbox_scrollbar()
+    def scroll_modules_to(self, first):
+        """
+        Moves the window of visible module rows so it starts at the given row.
 
-    def configure_resources_listbox_scrollbar(self):
+        Parameters:
+        - first: Index of the module row to show first, clamped to the available rows.
         """
-        Configures scrollbar for the resources listbox.
+        first = max(0, min(first, len(self._all_module_rows) - self._MODULE_ROWS_VISIBLE))
+        if first != self._module_first_row:
+            self._module_first_row = first
+            self.render_module_rows()
+
+    def select_module_row(self, index):
         """
-        scrollbar = tk.Scrollbar(self.resources_frame, orient="vertical")
-        scrollbar.grid(row=0, column=1, rowspan=2, sticky='nsew')
-        self.resources_listbox.config(yscrollcommand=scrollbar.set)
-        scrollbar.config(command=self.resources_listbox.yview)
+        Selects a module row, scrolling the window of visible rows so the row is shown.
 
-    def populate_modules_tree(self):
+        Parameters:
+        - index: Index of the module row in '_all_module_rows'.
         """
-        Populates the treeview widget in the modules frame with module information.
-        It displays each module's name, semester number, credits, exam type, and grade.
-        Modules are tagged with different colors based on their status (e.g., passed, failed, no grade).
-        This method also maintains a mapping between treeview item IDs and module IDs for easy management.
+        if index < self._module_first_row:
+            self.scroll_modules_to(index)
+        elif index >= self._module_first_row + self._MODULE_ROWS_VISIBLE:
+            self.scroll_modules_to(index - self._MODULE_ROWS_VISIBLE + 1)
+        self._selected_module_id = self._all_module_rows[index][0]
+        tree_id = self._module_row_cache[self._selected_module_id][0]
+        self.modules_tree.selection_set(tree_id)
+        self.modules_tree.focus(tree_id)
+        self.modules_tree.see(tree_id)
+
+    def move_module_selection(self, step):
         """
-        # Clear existing entries in the treeview
-        self.modules_tree.delete(*self.modules_tree.get_children())
-        # Reset the mapping between treeview IDs and module IDs
-        self.module_tree_id_to_module_id.clear()
-        
-        # Define tags for color-coding module entries based on their status
-        self.modules_tree.tag_configure('passed', background='#A2D5AB')  # Green
-        self.modules_tree.tag_configure('failed', background='#FFC0CB')  # Red
-        self.modules_tree.tag_configure('no_grade', background='#D3D3D3')  # Light grey
-
-        # Iterate through each semester and module to add module information to the treeview
-        for semester in self.logic.student.study_program.semesters:
-            for module in semester.modules:
-                # Determine the module's grade or use "N/A" if no grade is available
-                grade = module.grade.grade if module.grade else "N/A"
-                # Determine the appropriate tag based on the module's status
-                if module.status() == 'accepted' or (module.grade and isinstance(module.grade.grade, (int, float)) and module.grade.grade <= 4.0):
-                    tag = 'passed'
-                elif module.grade and isinstance(module.grade.grade, (int, float)) and module.grade.grade == 5.0:
-                    tag = 'failed'
-                else:
-                    tag = 'no_grade'
-                
-                # Insert the values into the tree with the appropriate tag
-                tree_id = self.modules_tree.insert("", "end", values=(module.name, semester.number, module.credits, module.exam_type, grade), tags=(tag,))
-                # Update the mapping with the new Treeview ID and module ID
-                self.module_tree_id_to_module_id[tree_id] = module.id
-        # Refresh the module frame with new information
-        self.refresh_progress_frame()
+        Moves the selection by the given number of module rows on navigation keys.
+
+        Parameters:
+        - step: Number of rows to move, negative to move up.
+
+        Returns:
+        - "break" to stop the treeview's own key handling.
+        """
+        if self._all_module_rows:
+            index = self._module_row_index.get(self._selected_module_id)
+            if index is None:
+                index = self._module_first_row  # Start from the first visible row if nothing is selected
+            else:
+                index = max(0, min(index + step, len(self._all_module_rows) - 1))
+            self.select_module_row(index)
+        return "break"
+
+    def on_modules_tree_select(self, event):
+        """
+        Remembers the selected module, so the selection survives its row being scrolled out of the treeview.
+
+        Parameters:
+        - event: The <<TreeviewSelect>> event.
+        """
+        selection = self.modules_tree.selection()
+        if selection:
+            self._selected_module_id = self.module_tree_id_to_module_id.get(selection[0])
+        elif self._selected_module_id in self._module_row_cache:
+            # The row is still shown, so the user deselected it. Otherwise it was only scrolled out.
+            self._selected_module_id = None
+
+    def on_modules_scrollbar(self, action, amount, unit=None):
+        """
+        Scrolls the window of visible module rows when the scrollbar is used.
+
+        Parameters:
+        - action: "moveto" when the slider is dragged, "scroll" when an arrow or the trough is clicked.
+        - amount: The fraction to move to, or the number of units or pages to scroll.
+        - unit: "units" or "pages" for the "scroll" action.
+        """
+        if action == "moveto":
+            self.scroll_modules_to(round(float(amount) * len(self._all_module_rows)))
+        elif unit == "pages":
+            self.scroll_modules_to(self._module_first_row + int(amount) * self._MODULE_ROWS_VISIBLE)
+        else:
+            self.scroll_modules_to(self._module_first_row + int(amount))
+
+    def on_modules_tree_scroll(self, event):
+        """
+        Scrolls the window of visible module rows on mouse wheel events.
+
+        Parameters:
+        - event: The <MouseWheel>, <Button-4> or <Button-5> event.
+
+        Returns:
+        - "break" to stop the treeview's own scrolling.
+        """
+        # X11 reports the wheel as buttons 4 and 5, other platforms through the sign of delta
+        if event.num == 4 or (event.num != 5 and event.delta > 0):
+            step = -self._MODULE_SCROLL_STEP
+        else:
+            step = self._MODULE_SCROLL_STEP
+        self.scroll_modules_to(self._module_first_row + step)
+        return "break"
 
     def add_resource_dialog(self):
         """
@@ -425,16 +718,12 @@ class GUI:
         Validates the input grade and updates the module's grade through the logic layer.
         If the grade is successfully updated, the Treeview is refreshed to show the change.
         """
-        # Retrieve the selected item from the Treeview
-        selected_item = self.modules_tree.selection()
-        if not selected_item:
+        # Retrieve the selected module, its row may be scrolled out of the Treeview
+        module_id = self._selected_module_id
+        if module_id is None:
             messagebox.showerror("Error", "Please select a module to edit its grade.")
             return
 
-        # Extract the module ID from the selected item
-        selected_item_id = selected_item[0]
-        module_id = self.module_tree_id_to_module_id.get(selected_item_id)
-
         while True:
             # Prompt the user for a new grade
             new_grade_str = simpledialog.askstring(
@@ -463,15 +752,11 @@ class GUI:
         If confirmed, it calls the logic layer to delete the module.
         The Treeview is refreshed to reflect the module's deletion.
         """
-        # Retrieve the selected item from the Treeview
-        selected_item = self.modules_tree.selection()
-        if not selected_item:
+        # Retrieve the selected module, its row may be scrolled out of the Treeview
+        module_id = self._selected_module_id
+        if module_id is None:
             messagebox.showerror("Error", "Please select a module to delete.")
             return
-
-        # Extract the module ID from the selected item
-        selected_item_id = selected_item[0]
-        module_id = self.module_tree_id_to_module_id.get(selected_item_id)
         
         # Confirm deletion with the user
         confirm = messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this module?")
@@ -485,51 +770,25 @@ class GUI:
 
     def add_module_dialog(self):
         """
-        Initiates a dialog sequence to gather information for adding a new module.
+        Opens a form to gather the information for adding a new module.
 
-        The dialog sequence prompts the user for the semester number, module name,
-        credits, exam type, and optionally, the grade. Validates each input step by step,
-        and if validation passes, the module is added to the student's record. The function
-        loops for grade input until a valid grade is entered or the operation is canceled.
+        The form asks for the semester number, module name, credits, exam type, and optionally,
+        the grade, all at once. The module is added through the logic layer when the form is submitted;
+        if that fails, e.g. because of an invalid grade, the error is shown and the form stays open.
         Upon successful addition, the modules Treeview is refreshed to include the new module.
         """
-        while True:
-            # Prompt for the semester number of the new module
-            semester_number = simpledialog.askinteger("Add Module", "Enter semester number:", parent=self.root)
-            if semester_number is None:  # Check for dialog cancellation
-                return
-
-            # Prompt for the module's name
-            name = simpledialog.askstring("Add Module", "Enter module name:", parent=self.root)
-            if not name:  # Validate module name is not empty
-                messagebox.showerror("Error", "Module name cannot be empty.")
-                continue  # Re-prompt for the name
-
-            # Prompt for the number of credits associated with the module
-            credits = simpledialog.askinteger("Add Module", "Enter credits:", parent=self.root)
-            if credits is None:  # Check for dialog cancellation
-                return
-
-            # Prompt for the type of exam associated with the module
-            exam_type = simpledialog.askstring("Add Module", "Enter exam type:", parent=self.root)
-            if not exam_type:  # Validate exam type is not empty
-                messagebox.showerror("Error", "Exam type cannot be empty.")
-                continue  # Re-prompt for the exam type
-
-            # Inner loop for grade input with validation
-            while True:
-                grade_str = simpledialog.askstring("Add Module", "Enter grade (leave blank if not available):", parent=self.root)
-                # Attempt to add the module with provided details, handling validation for the grade internally
-                success, message = self.logic.add_module(semester_number, name, credits, exam_type, grade_str)
-                if success:
-                    self.populate_modules_tree()  # Refresh the modules Treeview with the new addition
-                    return  # Exit the function upon successful module addition
-                else:
-                    messagebox.showerror("Error", message)  # Display specific error if module addition fails
-                    if "grade" in message.lower():  # If the error is specifically related to the grade, prompt again
-                        continue  # Prompt for grade again
-                    else:
-                        return  # Exit the function if the error is not related to the grade
+        def submit(values):
+            # Attempt to add the module with provided details, handling validation for the grade internally
+            return self.logic.add_module(values.semester_number, values.name, values.credits, values.exam_type, values.grade_str)
+
+        known_ids = set(self._module_row_index)
+        if AddModuleDialog(self.root, submit).show() is not None:
+            self.populate_modules_tree()  # Refresh the modules Treeview with the new addition
+            # Scroll to the new module and select it, it may be outside the visible rows
+            for module_id, index in self._module_row_index.items():
+                if module_id not in known_ids:
+                    self.select_module_row(index)
+                    break
 
     def run(self):
         """
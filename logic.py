@@ -1,12 +1,51 @@
-import webbrowser
-import time
+import atexit
+import itertools
+from array import array
+from contextlib import contextmanager
+from dataclasses import dataclass
 from resources import Resource
-from data_management import load_student_data, save_student_data, load_resources, save_resources
+from data_management import load_all, save_student_data, load_resources, save_resources_append, stage_resources, flush_resources
 from student import Student
 from semester import Semester
 from module import Modul, Grade
 from study_program import Study_program
 
+def _parse_grade(grade_str):
+    """
+    Parses a grade entered by the user.
+
+    Args:
+        grade_str (str): The grade as entered. 'a' indicates accepted, numeric values must be between 1.0 and 5.0.
+
+    Returns:
+        Grade or None: The parsed grade, or None if no grade was entered.
+
+    Raises:
+        ValueError: If the input is neither empty, 'a', nor a number between 1.0 and 5.0.
+    """
+    if not grade_str:
+        return None
+    grade_str = grade_str.strip()  # Strip only once
+    if not grade_str:
+        return None
+    if grade_str.lower() == 'a':
+        return Grade(grade='a')
+    grade_value = float(grade_str)
+    if not 1.0 <= grade_value <= 5.0:
+        raise ValueError("Grade must be 'a' or a number between 1.0 and 5.0.")
+    return Grade(grade=grade_value)
+
+@dataclass
+class ProgressSnapshot:
+    """
+    The student's progress metrics, computed together in a single pass over all modules for display in the GUI.
+    """
+    total_credits: int  # Total credits of all modules in the study program
+    completed_credits: int  # Credits of passed or accepted modules
+    progress: float  # Completed credits as a percentage of the total credits
+    average_grade: float | None  # Average of all numeric grades, or None if there are none
+    study_goal: float  # The student's targeted grade average
+
 class Logic:
     """
     The Logic class serves as the core operational backbone of the student dashboard application, handling data processing, storage, and retrieval tasks. 
@@ -19,7 +58,16 @@ class Logic:
         self.file_path = file_path
         self.student = None
         self.resources = []
+        self._resources_version = 0  # Incremented whenever the resources change
+        self._module_list = None  # Cached (semester number, module) pairs, rebuilt after modules are added or deleted
+        self._columns = None  # Credit and grade columns of the modules, rebuilt together with the module list
+        self._dirty_student = False  # Whether the student has changes that are not yet written to the file
+        self._module_index = None  # Maps module IDs to (module, semester) for lookups without scanning
+        self._next_id = None  # Counter for new module IDs, seeded from the existing IDs on first use
+        self._version = 0  # Incremented whenever the student data changes
+        self._cache = {}  # Computed metrics as (version, value), keyed by name
         self.initialize_data()
+        atexit.register(self.flush)  # Do not lose pending changes when the application exits
 
     def get_student_info(self):
         """
@@ -58,7 +106,8 @@ class Logic:
             self.student.matriculation_number = matriculation_number
             self.student.study_program.name = study_program
             self.student.study_goal = study_goal
-            save_student_data(self.student, self.file_path)  # Save the updated information to file
+            self._dirty_student = True  # The updated information is saved to file on the next flush
+            self._bump_version()
             return True
         else:
             return False  # Return False if there is no student data to update
@@ -66,9 +115,15 @@ class Logic:
     def initialize_data(self):
         """
         Loads student data from the JSON file or initializes default data if the file is not found.
+        The resources are loaded alongside the student data.
         """
+        self._module_list = None  # The cached modules belong to the previous student
+        self._columns = None
+        self._bump_version()
+        self._resources_version += 1  # The resources are reloaded as well
         try:
-            self.student = load_student_data(self.file_path)
+            # Load the student data and the resources concurrently
+            self.student, self.resources = load_all(self.file_path)
         except FileNotFoundError:
             # Create a default study program instance with minimal details
             default_study_program = Study_program(name="Undeclared Program", total_credits=0)
@@ -76,6 +131,108 @@ class Logic:
             self.student = Student(name="New Student", matriculation_number="000000", study_program=default_study_program)
             # Save the newly created student data for persistence
             save_student_data(self.student, self.file_path)
+            self.resources = load_resources()
+        # The module index is built on the first lookup, so loading does not deserialize all modules
+        self._module_index = None
+        self._next_id = None  # Seeded again from the loaded modules
+
+    def _get_module_index(self):
+        """
+        Returns the index from module IDs to their module and semester, building it by walking all semesters once if needed.
+        """
+        if self._module_index is None:
+            self._module_index = {}
+            for semester in self.student.study_program.semesters:
+                for module in semester.modules:
+                    # Keep the first module for duplicate IDs, like a linear search would find
+                    self._module_index.setdefault(module.id, (module, semester))
+        return self._module_index
+
+    def iter_modules(self):
+        """
+        Iterates over all modules of the study program in semester order.
+
+        The flat list of modules is built once and reused until modules are added or deleted.
+        Grade edits change the module objects in place and are therefore always visible.
+
+        Returns:
+            iterator: (semester number, module) tuples.
+        """
+        if self._module_list is None:
+            self._module_list = [(semester.number, module) for semester in self.student.study_program.semesters for module in semester.modules]
+        return iter(self._module_list)
+
+    def _bump_version(self):
+        """
+        Marks the student data as changed so memoized metrics are recomputed on next use.
+        """
+        self._version += 1
+        self._cache.clear()
+
+    def _memo(self, key, fn):
+        """
+        Returns the memoized result of fn for the current version of the student data.
+
+        Args:
+            key (str): The name the result is cached under.
+            fn (callable): Computes the result if it is not cached for the current version.
+
+        Returns:
+            The cached or newly computed result.
+        """
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        result = fn()
+        self._cache[key] = (self._version, result)
+        return result
+
+    def flush(self):
+        """
+        Writes all pending changes to the data files.
+
+        Changes to the student are collected and written here in one go instead of after every edit.
+        Staged resource changes are written as well.
+        """
+        if self._dirty_student:
+            save_student_data(self.student, self.file_path)
+            self._dirty_student = False
+        flush_resources()
+
+    @contextmanager
+    def batch(self):
+        """
+        Groups several edits so the data is written once when the block ends.
+
+        Usage:
+            with logic.batch():
+                logic.add_module(...)
+                logic.add_module(...)
+        """
+        try:
+            yield self
+        finally:
+            self.flush()
+
+    def _new_module_id(self, name):
+        """
+        Generates a unique ID for a new module.
+
+        The IDs are numbered by a counter that starts after the largest number used by the existing modules,
+        so modules added in quick succession never collide.
+
+        Args:
+            name (str): The name of the module.
+
+        Returns:
+            str: The new module ID.
+        """
+        if self._next_id is None:
+            # Continue after the numeric suffixes of existing IDs, e.g. the timestamps of older IDs.
+            # isdecimal rather than isdigit, which also accepts characters like "²" that int() rejects.
+            suffixes = (module.id.rpartition('_')[2] for _, module in self.iter_modules())
+            self._next_id = itertools.count(max((int(suffix) for suffix in suffixes if suffix.isdecimal()), default=0) + 1)
+        return f"module_{name.replace(' ', '_')}_{next(self._next_id)}"
 
     def find_module_by_id(self, module_id):
         """
@@ -84,11 +241,8 @@ class Logic:
         :param module_id: The ID of the module to find.
         :return: Tuple containing the found module and its semester number, or (None, None) if not found.
         """
-        for semester in self.student.study_program.semesters:
-            for module in semester.modules:
-                if module.id == module_id:
-                    return module, semester.number
-        return None, None
+        module, semester = self._get_module_index().get(module_id, (None, None))
+        return module, (semester.number if semester is not None else None)
 
     def add_module(self, semester_number, name, credits, exam_type, grade_str):
         """
@@ -113,25 +267,24 @@ class Logic:
             self.student.study_program.add_semester(semester)
 
         # Generate a unique module ID
-        module_id = f"module_{name.replace(' ', '_')}_{int(time.time())}"
-        grade = None  # Default the grade to None
-
-        # Validate and set the grade based on the input string
-        if grade_str:
-            try:
-                # Determine if grade is 'a' for accepted or convert to float for numeric grades
-                grade_value = 'a' if grade_str.strip().lower() == 'a' else float(grade_str)
-                if not (grade_value == 'a' or (isinstance(grade_value, float) and 1.0 <= grade_value <= 5.0)):
-                    raise ValueError("Grade must be 'a' or a number between 1.0 and 5.0.")
-                grade = Grade(grade=grade_value)
-            except ValueError as e:
-                return False, f"Not a valid grade or 'a' for accepted. Please try again."
+        module_id = self._new_module_id(name)
+
+        # Validate and set the grade based on the input string, no grade is None
+        try:
+            grade = _parse_grade(grade_str)
+        except ValueError:
+            return False, "Not a valid grade or 'a' for accepted. Please try again."
 
         # Attempt to add the module to the semester and save the updated student data
         try:
             new_module = Modul(id=module_id, name=name, credits=credits, exam_type=exam_type, grade=grade)
             semester.add_module_to_semester(new_module)  # Using the correct method name
-            save_student_data(self.student, self.file_path)
+            if self._module_index is not None:  # Otherwise the new module is indexed when the index is built
+                self._module_index.setdefault(module_id, (new_module, semester))
+            self._module_list = None  # Rebuild the flat module list on next use
+            self._columns = None
+            self._dirty_student = True
+            self._bump_version()
             return True, "Module added successfully."
         except Exception as e:
             return False, f"Failed to add the module. Error: {str(e)}"
@@ -157,14 +310,10 @@ class Logic:
 
         try:
             # Determine the appropriate grade value or set to None for an empty string
-            if new_grade_str.strip() == "":
-                module.grade = None
-            elif new_grade_str.strip().lower() == "a":
-                module.grade = Grade(grade="a")
-            else:
-                new_grade = float(new_grade_str)
-                module.grade = Grade(new_grade)
-            save_student_data(self.student, self.file_path)
+            module.grade = _parse_grade(new_grade_str)
+            self._update_module_columns(module)
+            self._dirty_student = True
+            self._bump_version()
             return True, ""  # Indicate successful update
         except ValueError:
             return False, "Not a valid grade or 'a' for accepted. Please try again."
@@ -173,7 +322,7 @@ class Logic:
         """
         Deletes a module identified by its module ID from the student's study program.
 
-        Iterates over the semesters to find and remove the specified module. If the module
+        Looks up the module and its semester in the module index and removes it. If the module
         is successfully found and removed, it checks if the semester now contains no modules
         and removes the semester if it's empty. The student data is saved after the deletion.
 
@@ -183,58 +332,66 @@ class Logic:
         Returns:
             bool: True if the module was successfully deleted, False if the module was not found.
         """
-        for semester in self.student.study_program.semesters:
-            # Attempt to find the module to delete in the current semester
-            module_to_delete = next((modul for modul in semester.modules if modul.id == module_id), None)
-            
-            if module_to_delete:
-                # If found, remove the module from the semester
-                semester.modules = [modul for modul in semester.modules if modul.id != module_id]
-                
-                # If the semester has no modules left, remove it from the study program
-                if not semester.modules:  
-                    self.student.study_program.remove_semester(semester.number)
-                    
-                save_student_data(self.student, self.file_path)  # Save the updated student data
-                return True  # Module deletion successful
-        return False  # Module not found, thus not deleted
+        # Attempt to find the module to delete and its semester
+        entry = self._get_module_index().pop(module_id, None)
+        if entry is None:
+            return False  # Module not found, thus not deleted
+
+        # If found, remove the module from the semester
+        module, semester = entry
+        semester.modules.remove(module)  # Stops at the module instead of copying the whole list
+        self._module_list = None  # Rebuild the flat module list on next use
+        self._columns = None
+
+        # If the semester has no modules left, remove it from the study program
+        if not semester.modules:
+            self.student.study_program.remove_semester(semester.number)
+
+        self._dirty_student = True  # The updated student data is saved on the next flush
+        self._bump_version()
+        return True  # Module deletion successful
 
     def get_resources(self):
         """
-        Loads and returns the list of resources from storage.
+        Returns the list of resources.
 
-        Attempts to load resources from the data storage. If the file containing
-        resources does not exist, initializes an empty list of resources.
+        The resources are loaded from storage once when the data is initialized and kept
+        up to date in memory by add_resource and delete_resource, so no file is read here.
 
         Returns:
             list: A list of dictionaries, each representing a resource with its 'name' and 'url'.
-                Returns an empty list if the resources file is not found.
+                The list is empty if the resources file was not found.
         """
-        try:
-            self.resources = load_resources()  # Attempt to load resources from storage
-        except FileNotFoundError:
-            self.resources = []  # Initialize an empty list if the file does not exist
         return self.resources  # Return the list of resources
 
+    def get_resources_version(self):
+        """
+        Retrieves a counter that changes whenever the resources are added, deleted or reloaded.
+
+        Returns:
+            int: The current version of the resources.
+        """
+        return self._resources_version
+
     def add_resource(self, name, url):
         """
-        Adds a new resource to the list of resources and saves it to the JSON file.
+        Adds a new resource to the list of resources and appends it to the resources file.
         Assumes that name and URL are valid non-empty strings.
         """
-        new_resource = Resource(name, url)
-        resources = load_resources()
-        resources.append(new_resource.to_dict())  # Convert to dictionary and append
-        save_resources(resources)  # Save the updated list of resources
+        new_resource = Resource(name, url).to_dict()
+        self.resources.append(new_resource)
+        save_resources_append(new_resource)  # Append only the new resource to the file
+        self._resources_version += 1
 
     def delete_resource(self, index):
         """
         Deletes a resource at the specified index from the list of resources
-        and saves the updated list to the JSON file.
+        and stages the updated list to be saved to the resources file.
         """
-        resources = load_resources()
         try:
-            resources.pop(index)  # Attempt to remove the resource at the given index
-            save_resources(resources)  # Save the updated list of resources
+            self.resources.pop(index)  # Attempt to remove the resource at the given index
+            stage_resources(self.resources)  # Stage the updated list, repeated deletions are written at once
+            self._resources_version += 1
             return True
         except IndexError:
             return False  # Return False if there was an error
@@ -255,10 +412,89 @@ class Logic:
         """
         if 0 <= index < len(self.resources):  # Check if index is within the range of the resources list
             resource_url = self.resources[index]['url']  # Retrieve the URL of the resource
+            import webbrowser  # Only needed here, so it is not imported at startup
             webbrowser.open(resource_url)  # Open the URL in the default web browser
             return True  # URL opening successful
         return False  # Index out of range, URL not opened
 
+    @staticmethod
+    def _grade_entry(modul):
+        """
+        Classifies a module's grade for the column storage.
+
+        Args:
+            modul (Modul): The module to classify.
+
+        Returns:
+            tuple: (completed credits, numeric grade or 0.0, 1 if the grade is numeric otherwise 0).
+        """
+        grade = modul.grade
+        if grade is None:
+            return 0, 0.0, 0
+        grade_value = grade.grade
+        if isinstance(grade_value, (int, float)):
+            return (modul.credits if grade_value <= 4.0 else 0), grade_value, 1  # Passed if 4.0 or better
+        if isinstance(grade_value, str) and grade_value.lower() == 'a':
+            return modul.credits, 0.0, 0  # Accepted
+        return 0, 0.0, 0
+
+    def _module_columns(self):
+        """
+        Returns the credit and grade statistics of all modules as columns, one entry per module in display order.
+
+        The columns are built in one traversal and kept until modules are added or deleted;
+        grade edits update the affected entries in place.
+
+        Returns:
+            tuple: (positions by module ID, credits, completed credits, numeric grades, numeric grade flags).
+        """
+        if self._columns is None:
+            positions = {}
+            credits = []  # Lists keep int credits as ints
+            completed = []
+            grades = array('d')
+            graded = array('b')
+            for position, (_, modul) in enumerate(self.iter_modules()):
+                positions.setdefault(modul.id, position)
+                credits.append(modul.credits)
+                completed_credits, grade_value, is_graded = self._grade_entry(modul)
+                completed.append(completed_credits)
+                grades.append(grade_value)
+                graded.append(is_graded)
+            self._columns = (positions, credits, completed, grades, graded)
+        return self._columns
+
+    def _update_module_columns(self, modul):
+        """
+        Updates the column entries of a module after its grade changed.
+
+        Args:
+            modul (Modul): The module whose grade changed.
+        """
+        if self._columns is None:
+            return  # The columns are built from the current grades on next use
+        positions, _, completed, grades, graded = self._columns
+        position = positions.get(modul.id)
+        if position is not None:
+            completed[position], grades[position], graded[position] = self._grade_entry(modul)
+
+    def _module_stats(self):
+        """
+        Collects the credit and grade statistics of all modules from the column storage.
+
+        Returns:
+            tuple: (total credits, completed credits, sum of numeric grades, number of numeric grades).
+        """
+        _, credits, completed, grades, graded = self._module_columns()
+        # The reductions run over the columns in C instead of visiting every module object
+        return sum(credits), sum(completed), sum(grades), sum(graded)
+
+    def _stats(self):
+        """
+        Returns the module statistics, computed at most once per change of the student data.
+        """
+        return self._memo('module_stats', self._module_stats)
+
     def calculate_progress(self):
         """
         Calculates the student's progress towards their study program completion as a percentage.
@@ -269,8 +505,7 @@ class Logic:
         Returns:
             float: Progress percentage, with 0 indicating no progress or no credits required.
         """
-        total_credits = self.get_total_credits()  # Total credits in the program
-        completed_credits = self.get_completed_credits()  # Credits the student has completed
+        total_credits, completed_credits, _, _ = self._stats()
         # Calculate progress percentage, ensuring no division by zero
         self.progress = (completed_credits / total_credits) * 100 if total_credits > 0 else 0
         return self.progress
@@ -287,14 +522,9 @@ class Logic:
         """
         if not self.student:
             return None  # Return None if there's no student data
-        
-        # Collect all numeric grades from modules
-        grades = [modul.grade.grade for semester in self.student.study_program.semesters for modul in semester.modules if modul.grade is not None and isinstance(modul.grade.grade, (int, float))]
-        if grades:
-            # Calculate and return the average if there are any grades to average
-            return sum(grades) / len(grades)
-        else:
-            return None
+        _, _, grade_sum, grade_count = self._stats()
+        # Calculate and return the average if there are any grades to average
+        return grade_sum / grade_count if grade_count else None
     
     def get_total_credits(self):
         """
@@ -303,7 +533,7 @@ class Logic:
         Returns:
         - The total number of credits.
         """
-        return self.student.study_program.get_total_credits()
+        return self._stats()[0]
 
     def get_completed_credits(self):
         """
@@ -312,5 +542,22 @@ class Logic:
         Returns:
         - The total number of completed credits.
         """
-        completed_credits = sum(modul.credits for semester in self.student.study_program.semesters for modul in semester.modules if modul.grade is not None and modul.status() in ['passed', 'accepted'])
-        return completed_credits
\ No newline at end of file
+        return self._stats()[1]
+
+    def get_progress_snapshot(self):
+        """
+        Computes all progress metrics shown in the GUI from a single traversal of the modules.
+
+        Returns:
+            ProgressSnapshot: The total and completed credits, the progress percentage,
+                the average grade (None if there are no numeric grades) and the study goal.
+        """
+        total_credits, completed_credits, grade_sum, grade_count = self._stats()
+        return ProgressSnapshot(
+            total_credits=total_credits,
+            completed_credits=completed_credits,
+            # Calculate progress percentage, ensuring no division by zero
+            progress=(completed_credits / total_credits) * 100 if total_credits > 0 else 0,
+            average_grade=grade_sum / grade_count if grade_count else None,
+            study_goal=self.student.study_goal
+        )
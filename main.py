@@ -1,16 +1,24 @@
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from gui import GUI
 from logic import Logic
 
 def main():
-    # Initialize the main window for the application
-    root = tk.Tk()
-    # Create an instance of the logic class
-    logic = Logic()  
+    # Create the instance of the logic class in the background, loading the data overlaps with initializing Tk
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        logic_future = executor.submit(Logic)
+        # Initialize the main window for the application, Tk must stay on the main thread
+        root = tk.Tk()
+        # Wait for the logic instance, errors while loading are raised here
+        logic = logic_future.result()
     # Create an instance of the GUI, passing both root and logic to the GUI
     app = GUI(root, logic)
-    # Start the application's main event loop, waiting for user interaction
-    app.run()
+    try:
+        # Start the application's main event loop, waiting for user interaction
+        app.run()
+    finally:
+        # Write any changes that are still pending once the window is closed
+        logic.flush()
 
 # Ensure that this script runs only when it is executed directly, not when imported
 if __name__ == "__main__":
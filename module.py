@@ -1,9 +1,11 @@
+from dataclasses import dataclass
+
+@dataclass(slots=True, eq=False)  # Grades compare by identity, as before
 class Grade:
     """
     Represents a grade for a module including the exam type and the grade itself.
     """
-    def __init__(self, grade):
-        self.grade = grade # The actual grade received
+    grade: float | str  # The actual grade received, a number or 'a' for accepted
 
     def to_dict(self):
         """
@@ -14,6 +16,15 @@ class Grade:
         """
         return {'grade': self.grade}
 
+    def _json_fields(self):
+        """
+        Provide the Grade's attributes for direct serialization by the JSON encoder.
+        
+        Returns:
+        - A dictionary of the Grade's attributes.
+        """
+        return {'grade': self.grade}
+
     @classmethod
     def from_dict(cls, data):
         """
@@ -31,6 +42,8 @@ class Modul:
     """
     Represents an academic module or course, including details like ID, name, credits, exam type, and grade.
     """
+    __slots__ = ('id', 'name', 'credits', 'exam_type', '_grade', '_status', '_json_cache')
+
     def __init__(self, id, name, credits, exam_type, grade=None):
         self.id = id # Unique identifier for the module
         self.name = name # Name of the module
@@ -38,6 +51,28 @@ class Modul:
         self.exam_type = exam_type # Type of exam for the module
         self.grade = grade if grade is None or isinstance(grade, Grade) else Grade.from_dict(grade)  # The grade object
 
+    @property
+    def grade(self):
+        """
+        The module's Grade object, or None if it has not been graded yet.
+        """
+        return self._grade
+
+    @grade.setter
+    def grade(self, grade):
+        # Determine the status once per assignment instead of on every status() call
+        self._grade = grade
+        # The grade is the only field that changes after creation, so the serialized dictionary is rebuilt
+        self._json_cache = None
+        if grade is None:
+            self._status = 'none'
+        elif isinstance(grade.grade, str) and grade.grade.lower() == 'a':
+            self._status = 'accepted'
+        elif isinstance(grade.grade, (int, float)) and grade.grade <= 4.0:
+            self._status = 'passed'
+        else:
+            self._status = 'none'
+
     def to_dict(self):
         """
         Serialize the Module object to a dictionary.
@@ -53,20 +88,35 @@ class Modul:
             'grade': self.grade.to_dict() if self.grade else None
         }
 
+    def _json_fields(self):
+        """
+        Provide the Module's attributes for direct serialization by the JSON encoder.
+        
+        Unlike to_dict, the grade is returned as the live Grade object, which the encoder serializes itself.
+        The dictionary is cached until the grade changes, so saving only rebuilds it for edited modules.
+        
+        Returns:
+        - A dictionary of the Module's attributes.
+        """
+        if self._json_cache is None:
+            self._json_cache = {
+                'id': self.id,
+                'name': self.name,
+                'credits': self.credits,
+                'exam_type': self.exam_type,
+                'grade': self.grade
+            }
+        return self._json_cache
+
     def status(self):
         """
         Determines the status of the module based on its grade.
+        The status is computed when the grade is assigned, so this is a plain attribute read.
         
         Returns:
         - A string indicating the status ('none', 'accepted', or 'passed').
         """
-        if self.grade is None:
-            return 'none'
-        if isinstance(self.grade.grade, str) and self.grade.grade.lower() == 'a':
-            return 'accepted'
-        if isinstance(self.grade.grade, (int, float)) and self.grade.grade <= 4.0:
-            return 'passed'
-        return 'none'
+        return self._status
 
     @classmethod
     def from_dict(cls, data):
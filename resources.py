@@ -1,12 +1,12 @@
-import webbrowser
+from dataclasses import dataclass
 
+@dataclass(slots=True)
 class Resource:
     """
     Represents an web resource with a name and a URL.
     """
-    def __init__(self, name, url):
-        self.name = name  # The resource's name (e.g., "IU Learn Platform")
-        self.url = url  # The resource's URL
+    name: str  # The resource's name (e.g., "IU Learn Platform")
+    url: str  # The resource's URL
 
     def to_dict(self):
         """
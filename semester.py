@@ -4,9 +4,50 @@ class Semester:
     """
     Represents an academic semester, containing multiple modules.
     """
+    __slots__ = ('number', '_modules', '_raw_modules')
+
     def __init__(self, number):
         self.number = number  # The semester number (e.g., 1 for the first semester)
-        self.modules = []  # A list to store the semester's modules
+        self._modules = []  # A list to store the semester's modules
+        self._raw_modules = None  # Serialized modules that have not been turned into Modul objects yet
+
+    @property
+    def modules(self):
+        """
+        The semester's modules. Modules loaded from a dictionary are deserialized on first access.
+        
+        Returns:
+        - The list of Modul objects of the semester.
+        """
+        if self._raw_modules is not None:
+            self._modules = [Modul.from_dict(modul_data) for modul_data in self._raw_modules]
+            self._raw_modules = None
+        return self._modules
+
+    @modules.setter
+    def modules(self, modules):
+        self._modules = modules
+        self._raw_modules = None
+
+    def has_modules(self):
+        """
+        Checks whether the semester contains any modules, without deserializing them.
+        
+        Returns:
+        - True if the semester has at least one module, False otherwise.
+        """
+        return bool(self._raw_modules if self._raw_modules is not None else self._modules)
+
+    def get_credits(self):
+        """
+        Calculates the total number of credits of the semester's modules, without deserializing them.
+        
+        Returns:
+        - The sum of the credits of all modules in the semester.
+        """
+        if self._raw_modules is not None:
+            return sum(modul_data['credits'] for modul_data in self._raw_modules)
+        return sum(modul.credits for modul in self._modules)
 
     def add_module_to_semester(self, modul):
         """
@@ -29,9 +70,27 @@ class Semester:
         Returns:
         - A dictionary containing the semester number and a list of modules.
         """
+        if self._raw_modules is not None:
+            # The loaded dictionaries may be shared with the file cache, so fresh ones are built without
+            # deserializing the modules for good
+            return {'number': self.number, 'modules': [Modul.from_dict(modul_data).to_dict() for modul_data in self._raw_modules]}
+        return {
+            'number': self.number,
+            'modules': [modul.to_dict() for modul in self._modules]
+        }
+
+    def _json_fields(self):
+        """
+        Provides the Semester's attributes for direct serialization by the JSON encoder.
+        
+        Unlike to_dict, the modules are returned as the live list of Modul objects, which the encoder serializes itself.
+        
+        Returns:
+        - A dictionary containing the semester number and the list of modules.
+        """
         return {
             'number': self.number,
-            'modules': [modul.to_dict() for modul in self.modules]
+            'modules': self._raw_modules if self._raw_modules is not None else self._modules
         }
 
     @classmethod
@@ -43,8 +102,8 @@ class Semester:
         - data: A dictionary containing the semester data.
         
         Returns:
-        - An instance of Semester initialized with the provided data.
+        - An instance of Semester initialized with the provided data. The modules are deserialized on first access.
         """
         semester = cls(data['number'])
-        semester.modules = [Modul.from_dict(modul_data) for modul_data in data.get('modules', [])]
+        semester._raw_modules = data.get('modules', [])
         return semester
@@ -1,13 +1,15 @@
+from dataclasses import dataclass
 from study_program import Study_program
 
+@dataclass(slots=True)
 class Student:
     """
     Represents a student with personal information, study progress, and associated study program.
     """
-    def __init__(self, name, matriculation_number, study_program):
-        self.name = name  # The student's full name
-        self.matriculation_number = matriculation_number  # Unique identifier for the student
-        self.study_program = study_program  # Associated study program object
+    name: str  # The student's full name
+    matriculation_number: str  # Unique identifier for the student
+    study_program: Study_program  # Associated study program object
+    study_goal: float = 0.0  # The targeted grade average
 
     def to_dict(self):
         """
@@ -23,6 +25,22 @@ class Student:
             'study_goal': self.study_goal
         }
 
+    def _json_fields(self):
+        """
+        Provides the Student's attributes for direct serialization by the JSON encoder.
+
+        Unlike to_dict, the study program is returned as the live Study_program object, which the encoder serializes itself.
+
+        Returns:
+        - A dictionary of the Student's attributes.
+        """
+        return {
+            'name': self.name,
+            'matriculation_number': self.matriculation_number,
+            'study_program': self.study_program,
+            'study_goal': self.study_goal
+        }
+
     @classmethod
     def from_dict(cls, data):
         """
@@ -35,6 +53,9 @@ class Student:
         - An instance of Student initialized with the provided data.
         """
         study_program_instance = Study_program.from_dict(data['study_program'])
-        student = cls(name=data['name'], matriculation_number=data['matriculation_number'], study_program=study_program_instance)
-        student.study_goal = data.get('study_goal', 0.0)  # Optional study goal
-        return student
+        return cls(
+            name=data['name'],
+            matriculation_number=data['matriculation_number'],
+            study_program=study_program_instance,
+            study_goal=data.get('study_goal', 0.0)  # Optional study goal
+        )
@@ -1,13 +1,28 @@
+from bisect import bisect, bisect_left
 from semester import Semester
 
 class Study_program:
     """
     Represents an academic study program, consisting of multiple semesters and modules.
     """
+    __slots__ = ('name', 'total_credits', 'semesters', '_by_number', '_order')
+
     def __init__(self, name, total_credits):
         self.name = name  # The name of the study program
         self.total_credits = total_credits  # The total number of credits required to complete the program
         self.semesters = []  # A list to store the semesters within the program
+        self._by_number = {}  # Maps semester numbers to their semester for lookups without scanning
+        self._order = []  # The sorted semester numbers, parallel to the semesters list
+
+    def _reindex(self):
+        """
+        Sorts the semesters by number and rebuilds the lookup structures from them.
+        """
+        self.semesters.sort(key=lambda semester: semester.number)
+        self._order = [semester.number for semester in self.semesters]
+        self._by_number = {}
+        for semester in self.semesters:
+            self._by_number.setdefault(semester.number, semester)
 
     def add_semester(self, semester):
         """
@@ -21,22 +36,14 @@ class Study_program:
         """
         if not isinstance(semester, Semester):
             raise ValueError("Only Semester instances can be added.")
-        if any(existing_semester.number == semester.number for existing_semester in self.semesters):
+        if semester.number in self._by_number:
             raise ValueError(f"Semester {semester.number} already exists.")
 
-        # Find the correct insertion index for the new semester to maintain order
-        insertion_index = None
-        for i, existing_semester in enumerate(self.semesters):
-            if existing_semester.number > semester.number:
-                insertion_index = i
-                break
-        
-        # If a suitable position was found, insert the semester at that index
-        if insertion_index is not None:
-            self.semesters.insert(insertion_index, semester)
-        else:
-            # If no such position was found, it means this is the latest semester, so append it
-            self.semesters.append(semester)
+        # Find the correct insertion index for the new semester to maintain order with a binary search
+        insertion_index = bisect(self._order, semester.number)
+        self._order.insert(insertion_index, semester.number)
+        self.semesters.insert(insertion_index, semester)
+        self._by_number[semester.number] = semester
 
     def remove_semester(self, semester_number):
         """
@@ -45,10 +52,16 @@ class Study_program:
         Parameters:
         - semester_number: The number of the semester to remove.
         """
-        # Filter out the semester with the given number
-        self.semesters = [semester for semester in self.semesters if semester.number != semester_number]
-        # Additionally, check and remove any semesters without modules
-        self.semesters = [semester for semester in self.semesters if semester.modules]
+        # Remove the semester with the given number at its sorted position
+        if self._by_number.pop(semester_number, None) is not None:
+            index = bisect_left(self._order, semester_number)
+            del self._order[index]
+            del self.semesters[index]
+        # Additionally, check and remove any semesters without modules in a single pass
+        remaining = [semester for semester in self.semesters if semester.has_modules()]
+        if len(remaining) != len(self.semesters):
+            self.semesters = remaining
+            self._reindex()
 
     def get_semester(self, semester_number):
         """
@@ -60,10 +73,7 @@ class Study_program:
         Returns:
         - The Semester object with the specified number, or None if not found.
         """
-        for semester in self.semesters:
-            if semester.number == semester_number:
-                return semester
-        return None
+        return self._by_number.get(semester_number)
 
     def get_total_credits(self):
         """
@@ -72,7 +82,7 @@ class Study_program:
         Returns:
         - The total number of credits for the entire study program.
         """
-        return sum(module.credits for semester in self.semesters for module in semester.modules)
+        return sum(semester.get_credits() for semester in self.semesters)
 
     def to_dict(self):
         """
@@ -87,6 +97,21 @@ class Study_program:
             'semesters': [semester.to_dict() for semester in self.semesters]
         }
 
+    def _json_fields(self):
+        """
+        Provides the StudyProgram's attributes for direct serialization by the JSON encoder.
+
+        Unlike to_dict, the semesters are returned as the live list of Semester objects, which the encoder serializes itself.
+
+        Returns:
+        - A dictionary containing the name, total credits, and the list of semesters.
+        """
+        return {
+            'name': self.name,
+            'total_credits': self.total_credits,
+            'semesters': self.semesters
+        }
+
     @classmethod
     def from_dict(cls, data):
         """
@@ -100,6 +125,7 @@ class Study_program:
         """
         study_program = cls(data['name'], data.get('total_credits', 0))
         study_program.semesters = [Semester.from_dict(sem) for sem in data.get('semesters', [])]
+        study_program._reindex()  # Build the lookup structures for the loaded semesters
         # Recalculate total credits in case it's not provided or needs updating based on loaded semester data
         study_program.total_credits = study_program.get_total_credits()
         return study_program
\ No newline at end of file